@@ -0,0 +1,86 @@
+"""
+Cache module for the REASON system
+Bounded, thread-safe cache with counter-based eviction
+"""
+
+import threading
+
+# Access counters are halved once any of them passes this value so that
+# entries which were popular long ago eventually become evictable
+_COUNTER_LIMIT = 2 ** 20
+
+# Returned by CounterCache.get for keys that are not cached
+MISSING = object()
+
+
+class CounterCache:
+    """
+    Bounded cache that evicts the least accessed entry when full
+    
+    Each entry keeps an access counter, so a hit is a single dict store
+    instead of reordering a recency list.
+    """
+    
+    def __init__(self, maxsize=128):
+        """
+        Initialize the cache
+        
+        Args:
+            maxsize (int, optional): Maximum number of cached entries
+        """
+        self.maxsize = maxsize
+        self._entries = {}
+        self._lock = threading.Lock()
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def __contains__(self, key):
+        return key in self._entries
+    
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._entries))
+    
+    def get(self, key):
+        """
+        Get a cached value and count the access
+        
+        Args:
+            key (str): Cache key
+            
+        Returns:
+            The cached value, or MISSING if the key is not cached
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            value, count = entry
+            count += 1
+            self._entries[key] = (value, count)
+            if count > _COUNTER_LIMIT:
+                self._entries = {k: (item, hits >> 1) for k, (item, hits) in self._entries.items()}
+            return value
+    
+    def put(self, key, value):
+        """
+        Store a value, evicting the least accessed entry when full
+        
+        Args:
+            key (str): Cache key
+            value: Value to cache
+        """
+        if self.maxsize <= 0:
+            return
+        
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.maxsize:
+                victim = min(self._entries.items(), key=lambda item: item[1][1])[0]
+                del self._entries[victim]
+            self._entries[key] = (value, 1)
+    
+    def clear(self):
+        """Remove every cached entry"""
+        with self._lock:
+            self._entries = {}
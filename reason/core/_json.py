@@ -0,0 +1,134 @@
+"""
+JSON module for the REASON system
+Shared JSON parsing and serialization backed by simdjson and orjson
+"""
+
+import json
+import logging
+import threading
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger("REASON.JSON")
+
+# Each thread keeps one parser for all of its fully materialized loads so
+# its internal buffers are recycled instead of reallocated per document.
+# A simdjson parser must not be used from several threads at once.
+_thread_state = threading.local()
+
+
+def _get_parser():
+    """
+    Get the simdjson parser owned by the current thread
+    
+    Returns:
+        simdjson.Parser: The thread's parser
+    """
+    parser = getattr(_thread_state, "parser", None)
+    if parser is None:
+        parser = _thread_state.parser = simdjson.Parser()
+    return parser
+
+
+def loads(raw, materialize=True):
+    """
+    Parse raw JSON bytes, using simdjson when it is available
+    
+    Args:
+        raw (bytes-like): JSON document to parse
+        materialize (bool, optional): Whether to convert the result into
+            plain Python objects. When False and simdjson is available, the
+            lazy simdjson element is returned instead.
+        
+    Returns:
+        The parsed document
+    """
+    if simdjson is None:
+        return json.loads(bytes(raw))
+    
+    if not materialize:
+        # A lazy element pins its parser for as long as it is alive, so it
+        # must not use the thread's shared parser
+        return simdjson.Parser().parse(raw)
+    
+    document = _get_parser().parse(raw)
+    if isinstance(document, simdjson.Object):
+        return document.as_dict()
+    if isinstance(document, simdjson.Array):
+        return document.as_list()
+    return document
+
+
+def dumps(data):
+    """
+    Serialize data as indented JSON bytes, using orjson when it is available
+    
+    Args:
+        data: Data to serialize
+        
+    Returns:
+        bytes: The serialized JSON document
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson rejects some types the stdlib accepts (e.g. int
+            # subclasses or integers beyond 64 bits)
+            pass
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def dumps_line(data):
+    """
+    Serialize data as a single compact JSON line for NDJSON files
+    
+    Args:
+        data: Data to serialize
+        
+    Returns:
+        bytes: The serialized JSON document followed by a newline
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass
+    return json.dumps(data, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def iter_ndjson(f, skip_invalid=False):
+    """
+    Lazily parse NDJSON records, one record per line
+    
+    Records are only parsed as they are consumed, so callers that stop
+    early never pay for the rest of the file. The caller owns the file and
+    is responsible for closing it.
+    
+    Args:
+        f (file): NDJSON file opened in binary mode
+        skip_invalid (bool, optional): Whether to log and skip lines that
+            are not valid JSON instead of raising
+        
+    Yields:
+        The parsed records
+    """
+    for line_number, line in enumerate(f, 1):
+        if not line.strip():
+            continue
+        try:
+            record = loads(line)
+        except ValueError as e:
+            if not skip_invalid:
+                raise
+            logger.warning("Skipping invalid NDJSON record on line %d: %s", line_number, e)
+            continue
+        yield record
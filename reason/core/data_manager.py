@@ -3,43 +3,137 @@ Data Manager module for the REASON system
 Handles loading, processing, and managing various types of data
 """
 
-import os
+import copy
 import logging
-import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+from ._cache import MISSING, CounterCache
+from ._json import dumps, dumps_line, iter_ndjson, loads
 
 logger = logging.getLogger("REASON.DataManager")
 
+
+def _default_placeholder(data_type, disease):
+    """
+    Generate generic placeholder data for data types without a template
+    
+    Args:
+        data_type (str): Type of data to generate
+        disease (str): Disease name to customize data
+        
+    Returns:
+        dict: Placeholder data
+    """
+    return {
+        "type": data_type,
+        "disease": disease,
+        "note": "Placeholder data",
+        "is_placeholder": True
+    }
+
+
+def _placeholder_factory(template):
+    """
+    Create a placeholder generator that fills the disease into a copy of template
+    
+    Args:
+        template (dict): Placeholder data with an empty disease field
+        
+    Returns:
+        callable: Generator taking (data_type, disease)
+    """
+    def factory(data_type, disease):
+        # Deep copy so callers cannot mutate the shared nested lists
+        placeholder = copy.deepcopy(template)
+        placeholder["disease"] = disease
+        return placeholder
+    return factory
+
+
+# Placeholder generators by data type
+_PLACEHOLDER_FACTORIES = {
+    "gene_expression": _placeholder_factory({
+        "type": "gene_expression",
+        "disease": None,
+        "genes": ["GENE1", "GENE2", "GENE3"],
+        "values": [1.2, -0.8, 2.5],
+        "is_placeholder": True
+    }),
+    "proteomics": _placeholder_factory({
+        "type": "proteomics",
+        "disease": None,
+        "proteins": ["PROT1", "PROT2", "PROT3"],
+        "values": [0.9, 1.5, -1.1],
+        "is_placeholder": True
+    }),
+    "pathways": _placeholder_factory({
+        "type": "pathways",
+        "disease": None,
+        "pathways": [
+            {"id": "PW1", "name": "Inflammatory Response", "genes": ["GENE1", "GENE2"]},
+            {"id": "PW2", "name": "Cell Cycle", "genes": ["GENE3", "GENE4"]},
+            {"id": "PW3", "name": "Apoptosis", "genes": ["GENE2", "GENE5"]}
+        ],
+        "is_placeholder": True
+    })
+}
+
+
+@lru_cache(maxsize=512)
+def _compute_data_path(data_root, data_type, dataset_name=None, extension="json"):
+    """
+    Compute the path to a data file or directory
+    
+    Args:
+        data_root (Path): Directory containing the data files
+        data_type (str): Type of data
+        dataset_name (str, optional): Specific dataset name
+        extension (str, optional): File extension of the dataset
+        
+    Returns:
+        Path: Path to the data file or directory
+    """
+    base_path = data_root / data_type
+    if dataset_name:
+        return base_path / f"{dataset_name}.{extension}"
+    return base_path
+
+
 class DataManager:
     """
     Manages data loading and processing for the REASON system
     """
     
-    def __init__(self, data_dir="data"):
+    def __init__(self, data_dir="data", cache_max=128, max_threads=4):
         """
         Initialize the data manager
         
         Args:
             data_dir (str): Directory containing the data files
+            cache_max (int, optional): Maximum number of cached datasets
+            max_threads (int, optional): Maximum number of threads used for bulk loads
         """
         self.data_dir = data_dir
-        self.cache = {}
-        logger.info(f"DataManager initialized with data directory: {data_dir}")
+        self._data_root = Path(data_dir)
+        self.cache = CounterCache(cache_max)
+        self.max_threads = max_threads
+        logger.info("DataManager initialized with data directory: %s", data_dir)
     
-    def get_data_path(self, data_type, dataset_name=None):
+    def get_data_path(self, data_type, dataset_name=None, extension="json"):
         """
         Get the path to a specific data file or directory
         
         Args:
             data_type (str): Type of data (e.g., 'gene_expression', 'proteomics')
             dataset_name (str, optional): Specific dataset name
+            extension (str, optional): File extension of the dataset
             
         Returns:
-            str: Path to the data file or directory
+            Path: Path to the data file or directory
         """
-        base_path = os.path.join(self.data_dir, data_type)
-        if dataset_name:
-            return os.path.join(base_path, f"{dataset_name}.json")
-        return base_path
+        return _compute_data_path(self._data_root, data_type, dataset_name, extension)
     
     def load_dataset(self, data_type, disease=None, use_cache=True):
         """
@@ -55,32 +149,80 @@ class DataManager:
         """
         cache_key = f"{data_type}_{disease}" if disease else data_type
         
-        if use_cache and cache_key in self.cache:
-            logger.debug(f"Using cached data for {cache_key}")
-            return self.cache[cache_key]
+        if use_cache:
+            data = self.cache.get(cache_key)
+            if data is not MISSING:
+                logger.debug("Using cached data for %s", cache_key)
+                return data
         
         data_path = self.get_data_path(data_type, disease)
         
-        if os.path.exists(data_path):
-            try:
-                logger.info(f"Loading data from {data_path}")
-                with open(data_path, 'r') as f:
-                    data = json.load(f)
-                
-                if use_cache:
-                    self.cache[cache_key] = data
-                
-                return data
-            except Exception as e:
-                logger.error(f"Error loading data from {data_path}: {str(e)}")
-                return {"error": str(e)}
-        else:
-            logger.warning(f"Data file not found: {data_path}")
+        try:
+            data = self._read_dataset(data_type, disease)
+        except FileNotFoundError:
+            logger.warning("Data file not found: %s", data_path)
             # Return placeholder data for demonstration
             placeholder_data = self._generate_placeholder_data(data_type, disease)
             if use_cache:
-                self.cache[cache_key] = placeholder_data
+                self.cache.put(cache_key, placeholder_data)
             return placeholder_data
+        except Exception as e:
+            logger.error("Error loading data from %s: %s", data_path, e)
+            return {"error": str(e)}
+        
+        if use_cache:
+            self.cache.put(cache_key, data)
+        
+        return data
+    
+    def _read_dataset(self, data_type, dataset_name):
+        """
+        Read a dataset file, falling back to the NDJSON file written for lists
+        
+        Args:
+            data_type (str): Type of data
+            dataset_name (str): Name of the dataset
+            
+        Returns:
+            dict or list: The parsed dataset
+            
+        Raises:
+            FileNotFoundError: If neither the JSON nor the NDJSON file exists
+        """
+        data_path = self.get_data_path(data_type, dataset_name)
+        try:
+            with open(data_path, 'rb') as f:
+                logger.info("Loading data from %s", data_path)
+                return loads(f.read())
+        except FileNotFoundError:
+            records_path = self.get_data_path(data_type, dataset_name, "ndjson")
+            with open(records_path, 'rb') as f:
+                records = list(iter_ndjson(f))
+            logger.info("Loaded records from %s", records_path)
+            return records
+    
+    def load_datasets(self, data_types, disease=None, use_cache=True):
+        """
+        Load several datasets for a disease in parallel
+        
+        File reads and JSON parsing happen largely outside the GIL, so the
+        datasets are loaded on a thread pool rather than one after another.
+        
+        Args:
+            data_types (list): Types of data to load
+            disease (str, optional): Disease name to filter data
+            use_cache (bool, optional): Whether to use cached data
+            
+        Returns:
+            dict: The loaded datasets keyed by data type
+        """
+        data_types = list(data_types)
+        if not data_types:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_threads, len(data_types))) as executor:
+            datasets = executor.map(lambda data_type: self.load_dataset(data_type, disease, use_cache), data_types)
+            return dict(zip(data_types, datasets))
     
     def _generate_placeholder_data(self, data_type, disease=None):
         """
@@ -93,70 +235,77 @@ class DataManager:
         Returns:
             dict: Placeholder data
         """
-        if data_type == "gene_expression":
-            return {
-                "type": "gene_expression",
-                "disease": disease,
-                "genes": ["GENE1", "GENE2", "GENE3"],
-                "values": [1.2, -0.8, 2.5],
-                "is_placeholder": True
-            }
-        elif data_type == "proteomics":
-            return {
-                "type": "proteomics",
-                "disease": disease,
-                "proteins": ["PROT1", "PROT2", "PROT3"],
-                "values": [0.9, 1.5, -1.1],
-                "is_placeholder": True
-            }
-        elif data_type == "pathways":
-            return {
-                "type": "pathways",
-                "disease": disease,
-                "pathways": [
-                    {"id": "PW1", "name": "Inflammatory Response", "genes": ["GENE1", "GENE2"]},
-                    {"id": "PW2", "name": "Cell Cycle", "genes": ["GENE3", "GENE4"]},
-                    {"id": "PW3", "name": "Apoptosis", "genes": ["GENE2", "GENE5"]}
-                ],
-                "is_placeholder": True
-            }
-        else:
-            return {
-                "type": data_type,
-                "disease": disease,
-                "note": "Placeholder data",
-                "is_placeholder": True
-            }
+        factory = _PLACEHOLDER_FACTORIES.get(data_type, _default_placeholder)
+        return factory(data_type, disease)
     
     def save_dataset(self, data, data_type, dataset_name):
         """
         Save dataset to a file
         
+        Lists of records are stored as NDJSON (one record per line) so they
+        can be streamed back with load_ndjson. Any copy of the dataset saved
+        in the other format is removed.
+        
         Args:
-            data (dict): Data to save
+            data (dict or list): Data to save
             data_type (str): Type of data
             dataset_name (str): Name of the dataset
             
         Returns:
             bool: True if saved successfully, False otherwise
         """
-        data_path = self.get_data_path(data_type, dataset_name)
+        is_records = isinstance(data, list)
+        data_path = self.get_data_path(data_type, dataset_name, "ndjson" if is_records else "json")
+        stale_path = self.get_data_path(data_type, dataset_name, "json" if is_records else "ndjson")
         
         # Ensure directory exists
-        os.makedirs(os.path.dirname(data_path), exist_ok=True)
+        data_path.parent.mkdir(parents=True, exist_ok=True)
         
         try:
-            with open(data_path, 'w') as f:
-                json.dump(data, f, indent=2)
-            logger.info(f"Data saved to {data_path}")
+            with open(data_path, 'wb') as f:
+                if is_records:
+                    f.writelines(dumps_line(record) for record in data)
+                else:
+                    f.write(dumps(data))
+            # Drop a copy saved in the other format so loads see this one
+            stale_path.unlink(missing_ok=True)
+            logger.info("Data saved to %s", data_path)
             return True
         except Exception as e:
-            logger.error(f"Error saving data to {data_path}: {str(e)}")
+            logger.error("Error saving data to %s: %s", data_path, e)
             return False
     
+    def load_ndjson(self, data_type, dataset_name):
+        """
+        Stream the records of an NDJSON dataset
+        
+        Records are parsed lazily, so callers that only need the first few
+        can stop early (e.g. with itertools.islice) without parsing the rest.
+        The file is only opened once iteration starts and is closed when the
+        iterator is exhausted or discarded.
+        
+        Args:
+            data_type (str): Type of data
+            dataset_name (str): Name of the dataset
+            
+        Yields:
+            The dataset records
+        """
+        data_path = self.get_data_path(data_type, dataset_name, "ndjson")
+        
+        try:
+            f = open(data_path, 'rb')
+        except FileNotFoundError:
+            logger.warning("Data file not found: %s", data_path)
+            return
+        
+        with f:
+            logger.info("Streaming records from %s", data_path)
+            yield from iter_ndjson(f)
+    
     def clear_cache(self):
         """Clear the data cache"""
-        self.cache = {}
+        self.cache.clear()
         logger.debug("Data cache cleared")
     
     def close(self):
@@ -4,27 +4,182 @@ Provides access to structured biological and medical knowledge
 """
 
 import os
+import copy
 import logging
-import json
-import time
+import mmap
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import islice
+from pathlib import Path
+
+from ._cache import MISSING, CounterCache
+from ._json import iter_ndjson, loads
 
 logger = logging.getLogger("REASON.KnowledgeBase")
 
+# Placeholder disease information; the name field is filled in per call
+_DISEASE_TEMPLATE = {
+    "name": None,
+    "description": "A condition characterized by abnormal function or structure.",
+    "categories": ["example_category"],
+    "icd10": "X00.0",
+    "symptoms": [
+        {"name": "Symptom 1", "prevalence": "common"},
+        {"name": "Symptom 2", "prevalence": "uncommon"},
+        {"name": "Symptom 3", "prevalence": "rare"}
+    ],
+    "associated_genes": [
+        {"id": "GENE1", "name": "Gene 1", "evidence": "strong"},
+        {"id": "GENE2", "name": "Gene 2", "evidence": "moderate"},
+        {"id": "GENE3", "name": "Gene 3", "evidence": "weak"}
+    ],
+    "prevalence": "5 in 100,000",
+    "risk_factors": ["Risk factor 1", "Risk factor 2"],
+    "treatments": [
+        {"id": "TREATMENT1", "name": "Treatment 1", "type": "drug"},
+        {"id": "TREATMENT2", "name": "Treatment 2", "type": "procedure"}
+    ],
+    "is_placeholder": True
+}
+
+class DiseaseInfo(Mapping):
+    """
+    Read-only mapping view of disease information
+    Fields are looked up on demand from the parsed document rather than
+    converting the whole document into Python objects up front.
+    
+    When the document was parsed by simdjson, nested values (lists and
+    objects) are returned as lazy simdjson proxies rather than plain lists
+    and dicts, and cannot be serialized directly. Use as_dict(), or
+    get_disease_information(..., materialize=True), when plain Python
+    objects are needed.
+    """
+    
+    def __init__(self, element):
+        """
+        Initialize the disease information view
+        
+        Args:
+            element: Parsed disease document (simdjson element or dict)
+        """
+        self._element = element
+    
+    def __getitem__(self, key):
+        if hasattr(self._element, "at_pointer"):
+            # Escape the key as a JSON pointer token (RFC 6901)
+            token = key.replace("~", "~0").replace("/", "~1")
+            return self._element.at_pointer(f"/{token}")
+        return self._element[key]
+    
+    def __contains__(self, key):
+        return key in self._element
+    
+    def __iter__(self):
+        return iter(self._element.keys())
+    
+    def __len__(self):
+        return len(self._element)
+    
+    def __repr__(self):
+        return f"DiseaseInfo({self.as_dict()!r})"
+    
+    def as_dict(self):
+        """
+        Convert the disease information into plain Python objects
+        
+        Returns:
+            dict: Fully materialized disease information
+        """
+        if hasattr(self._element, "as_dict"):
+            return self._element.as_dict()
+        return dict(self._element)
+
+
+@lru_cache(maxsize=1024)
+def _pathway_information(pathway_id):
+    """
+    Build information about a biological pathway
+    
+    Args:
+        pathway_id (str): ID of the pathway
+        
+    Returns:
+        dict: Pathway information
+    """
+    # Generate placeholder data
+    return {
+        "id": pathway_id,
+        "name": f"Pathway {pathway_id}",
+        "description": "Biological pathway involved in cellular function",
+        "genes": ["GENE1", "GENE2", "GENE3", "GENE4"],
+        "interactions": [
+            {"source": "GENE1", "target": "GENE2", "type": "activation"},
+            {"source": "GENE2", "target": "GENE3", "type": "inhibition"},
+            {"source": "GENE3", "target": "GENE4", "type": "binding"}
+        ],
+        "is_placeholder": True
+    }
+
+
+@lru_cache(maxsize=1024)
+def _drug_information(drug_id):
+    """
+    Build information about a drug
+    
+    Args:
+        drug_id (str): ID of the drug
+        
+    Returns:
+        dict: Drug information
+    """
+    # Generate placeholder data
+    return {
+        "id": drug_id,
+        "name": f"Drug {drug_id}",
+        "description": "Pharmaceutical compound used for treatment",
+        "mechanism": "Inhibits protein function",
+        "targets": ["TARGET1", "TARGET2"],
+        "indications": ["Disease 1", "Disease 2"],
+        "contraindications": ["Condition 1", "Condition 2"],
+        "side_effects": ["Side effect 1", "Side effect 2"],
+        "is_placeholder": True
+    }
+
+
+@lru_cache(maxsize=1024)
+def _normalize_disease_name(disease_name):
+    """
+    Normalize a disease name for cache keys and file names
+    
+    Args:
+        disease_name (str): Name of the disease
+        
+    Returns:
+        str: Lowercase name with whitespace runs replaced by underscores
+    """
+    return "_".join(disease_name.split()).lower()
+
+
 class KnowledgeBase:
     """
     Knowledge Base for the REASON system
     Provides structured access to biological and medical knowledge
     """
     
-    def __init__(self, data_dir="data"):
+    def __init__(self, data_dir="data", cache_max=128):
         """
         Initialize the knowledge base
         
         Args:
             data_dir (str): Directory containing knowledge data
+            cache_max (int, optional): Maximum number of cached disease entries
         """
         self.data_dir = data_dir
-        self.cache = {}
+        self._disease_dir = Path(data_dir) / "diseases"
+        self._publications_file = Path(data_dir) / "publications" / "publications.ndjson"
+        self.cache = CounterCache(cache_max)
+        self._disease_index = {}
         
         # Create knowledge directories if they don't exist
         self.knowledge_dirs = [
@@ -35,42 +190,91 @@ class KnowledgeBase:
             os.path.join(data_dir, "publications")
         ]
         
-        for directory in self.knowledge_dirs:
-            os.makedirs(directory, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=len(self.knowledge_dirs)) as executor:
+            list(executor.map(partial(os.makedirs, exist_ok=True), self.knowledge_dirs))
         
         logger.info("Knowledge Base initialized")
     
-    def get_disease_information(self, disease_name):
+    def get_disease_information(self, disease_name, materialize=False):
         """
         Get comprehensive information about a disease
         
         Args:
             disease_name (str): Name of the disease
+            materialize (bool, optional): Whether to return a plain dict
+                instead of a lazy DiseaseInfo view
             
         Returns:
-            dict: Disease information
+            DiseaseInfo or dict: Disease information
         """
-        cache_key = f"disease_{disease_name}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        normalized_name = _normalize_disease_name(disease_name)
+        cache_key = f"disease_{normalized_name}"
+        disease_info = self.cache.get(cache_key)
+        if disease_info is not MISSING:
+            return disease_info.as_dict() if materialize else disease_info
         
         # Check if we have a stored file for this disease
-        disease_file = os.path.join(self.data_dir, "diseases", f"{disease_name.replace(' ', '_')}.json")
-        
-        if os.path.exists(disease_file):
+        for disease_file in self._disease_file_candidates(normalized_name):
             try:
-                with open(disease_file, 'r') as f:
-                    disease_info = json.load(f)
-                self.cache[cache_key] = disease_info
-                return disease_info
+                # Map the file instead of reading it so large records are not
+                # copied into an intermediate bytes object
+                with open(disease_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    disease_info = DiseaseInfo(loads(mm, materialize=False))
+                self.cache.put(cache_key, disease_info)
+                return disease_info.as_dict() if materialize else disease_info
+            except FileNotFoundError:
+                continue
             except Exception as e:
-                logger.error(f"Error loading disease information: {str(e)}")
+                logger.error("Error loading disease information: %s", e)
+                break
         
         # If no data file exists, create placeholder data
-        logger.info(f"Creating placeholder data for disease: {disease_name}")
-        disease_info = self._generate_disease_placeholder(disease_name)
-        self.cache[cache_key] = disease_info
-        return disease_info
+        logger.info("Creating placeholder data for disease: %s", disease_name)
+        disease_info = DiseaseInfo(self._generate_disease_placeholder(disease_name))
+        self.cache.put(cache_key, disease_info)
+        return disease_info.as_dict() if materialize else disease_info
+    
+    def _disease_file_candidates(self, normalized_name):
+        """
+        Yield the stored files that may hold information about a disease
+        
+        The normalized file name is tried first. Files saved under other
+        spellings (e.g. Alzheimer_Disease.json) are found through an index of
+        the diseases directory keyed by normalized stem, which is rebuilt
+        when a name is missing so that newly added files are picked up.
+        
+        Args:
+            normalized_name (str): Normalized name of the disease
+            
+        Yields:
+            Path: Candidate disease files
+        """
+        direct_file = self._disease_dir / f"{normalized_name}.json"
+        yield direct_file
+        
+        if normalized_name not in self._disease_index:
+            self._disease_index = self._index_disease_files()
+        indexed_file = self._disease_index.get(normalized_name)
+        if indexed_file is not None and indexed_file != direct_file:
+            yield indexed_file
+    
+    def _index_disease_files(self):
+        """
+        Index the stored disease files by normalized name
+        
+        Returns:
+            dict: Paths of the disease files keyed by normalized stem
+        """
+        try:
+            entries = list(os.scandir(self._disease_dir))
+        except FileNotFoundError:
+            return {}
+        
+        return {
+            _normalize_disease_name(entry.name[:-len(".json")]): Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(".json")
+        }
     
     def _generate_disease_placeholder(self, disease_name):
         """
@@ -82,32 +286,10 @@ class KnowledgeBase:
         Returns:
             dict: Placeholder disease information
         """
-        # Simulate processing time
-        time.sleep(0.5)
-        
-        return {
-            "name": disease_name,
-            "description": f"A condition characterized by abnormal function or structure.",
-            "categories": ["example_category"],
-            "icd10": "X00.0",
-            "symptoms": [
-                {"name": "Symptom 1", "prevalence": "common"},
-                {"name": "Symptom 2", "prevalence": "uncommon"},
-                {"name": "Symptom 3", "prevalence": "rare"}
-            ],
-            "associated_genes": [
-                {"id": "GENE1", "name": "Gene 1", "evidence": "strong"},
-                {"id": "GENE2", "name": "Gene 2", "evidence": "moderate"},
-                {"id": "GENE3", "name": "Gene 3", "evidence": "weak"}
-            ],
-            "prevalence": "5 in 100,000",
-            "risk_factors": ["Risk factor 1", "Risk factor 2"],
-            "treatments": [
-                {"id": "TREATMENT1", "name": "Treatment 1", "type": "drug"},
-                {"id": "TREATMENT2", "name": "Treatment 2", "type": "procedure"}
-            ],
-            "is_placeholder": True
-        }
+        # Deep copy so callers cannot mutate the shared nested lists
+        disease_info = copy.deepcopy(_DISEASE_TEMPLATE)
+        disease_info["name"] = disease_name
+        return disease_info
     
     def get_pathway_information(self, pathway_id):
         """
@@ -119,26 +301,7 @@ class KnowledgeBase:
         Returns:
             dict: Pathway information
         """
-        cache_key = f"pathway_{pathway_id}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
-        
-        # Generate placeholder data
-        pathway_info = {
-            "id": pathway_id,
-            "name": f"Pathway {pathway_id}",
-            "description": "Biological pathway involved in cellular function",
-            "genes": ["GENE1", "GENE2", "GENE3", "GENE4"],
-            "interactions": [
-                {"source": "GENE1", "target": "GENE2", "type": "activation"},
-                {"source": "GENE2", "target": "GENE3", "type": "inhibition"},
-                {"source": "GENE3", "target": "GENE4", "type": "binding"}
-            ],
-            "is_placeholder": True
-        }
-        
-        self.cache[cache_key] = pathway_info
-        return pathway_info
+        return _pathway_information(pathway_id)
     
     def get_drug_information(self, drug_id):
         """
@@ -150,30 +313,16 @@ class KnowledgeBase:
         Returns:
             dict: Drug information
         """
-        cache_key = f"drug_{drug_id}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
-        
-        # Generate placeholder data
-        drug_info = {
-            "id": drug_id,
-            "name": f"Drug {drug_id}",
-            "description": "Pharmaceutical compound used for treatment",
-            "mechanism": "Inhibits protein function",
-            "targets": ["TARGET1", "TARGET2"],
-            "indications": ["Disease 1", "Disease 2"],
-            "contraindications": ["Condition 1", "Condition 2"],
-            "side_effects": ["Side effect 1", "Side effect 2"],
-            "is_placeholder": True
-        }
-        
-        self.cache[cache_key] = drug_info
-        return drug_info
+        return _drug_information(drug_id)
     
     def search_literature(self, query, max_results=10):
         """
         Search scientific literature for information
         
+        Publications are read from the NDJSON store in the publications
+        directory when it exists; parsing stops once enough matches are found.
+        Malformed records in the store are logged and skipped.
+        
         Args:
             query (str): Search query
             max_results (int): Maximum number of results to return
@@ -181,10 +330,28 @@ class KnowledgeBase:
         Returns:
             list: Publication information
         """
+        if max_results <= 0:
+            return []
+        
+        try:
+            f = open(self._publications_file, 'rb')
+        except FileNotFoundError:
+            f = None
+        
+        if f is not None:
+            needle = query.lower()
+            with f:
+                matches = (
+                    publication for publication in iter_ndjson(f, skip_invalid=True)
+                    if isinstance(publication, dict)
+                    and (needle in (publication.get("title") or "").lower()
+                         or needle in (publication.get("abstract") or "").lower())
+                )
+                return list(islice(matches, max_results))
+        
         # Generate placeholder data
-        publications = []
-        for i in range(1, min(max_results + 1, 6)):
-            publications.append({
+        publications = [
+            {
                 "id": f"PUB{i}",
                 "title": f"Research on {query} - Study {i}",
                 "authors": ["Author A", "Author B"],
@@ -193,7 +360,9 @@ class KnowledgeBase:
                 "abstract": f"This study investigates {query} and its effects on health.",
                 "url": f"https://example.com/publication{i}",
                 "is_placeholder": True
-            })
+            }
+            for i in range(1, min(max_results + 1, 6))
+        ]
         
         return publications
     
@@ -216,7 +385,9 @@ class KnowledgeBase:
     
     def clear_cache(self):
         """Clear the knowledge cache"""
-        self.cache = {}
+        self.cache.clear()
+        _pathway_information.cache_clear()
+        _drug_information.cache_clear()
         logger.debug("Knowledge cache cleared")
     
     def close(self):
@@ -7,12 +7,14 @@ Main entry point for the REASON system
 import os
 import sys
 import argparse
+import importlib.util
 import logging
 import time
-import json
 from datetime import datetime
 from pathlib import Path
 
+from reason.core._json import dumps, loads
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -54,17 +56,18 @@ class REASONSystem:
             "default_level": "standard",
             "cache_enabled": True,
             "max_threads": 4,
+            "simulate_latency": False,
             "api_keys": {}
         }
         
         if config_file and os.path.exists(config_file):
             try:
-                with open(config_file, 'r') as f:
-                    user_config = json.load(f)
-                    config.update(user_config)
-                self.logger.info(f"Configuration loaded from {config_file}")
+                with open(config_file, 'rb') as f:
+                    user_config = loads(f.read())
+                config.update(user_config)
+                self.logger.info("Configuration loaded from %s", config_file)
             except Exception as e:
-                self.logger.error(f"Error loading configuration: {str(e)}")
+                self.logger.error("Error loading configuration: %s", e)
         
         return config
     
@@ -75,30 +78,30 @@ class REASONSystem:
     
     def check_dependencies(self):
         """Check if required libraries are available"""
-        try:
-            import numpy
-            import pandas
+        # Only look the modules up; importing them (tensorflow in particular)
+        # would cost seconds of startup time for runs that never use them
+        missing = [name for name in ("numpy", "pandas") if importlib.util.find_spec(name) is None]
+        if missing:
+            self.logger.warning("Missing scientific library: %s", ", ".join(missing))
+        else:
             self.logger.info("Core scientific libraries available")
-        except ImportError as e:
-            self.logger.warning(f"Missing scientific library: {str(e)}")
         
-        try:
-            import torch
-            import tensorflow
+        missing = [name for name in ("torch", "tensorflow") if importlib.util.find_spec(name) is None]
+        if missing:
+            self.logger.warning("Missing ML library: %s", ", ".join(missing))
+        else:
             self.logger.info("Machine learning libraries available")
-        except ImportError as e:
-            self.logger.warning(f"Missing ML library: {str(e)}")
         
         # Other dependency checks can be added here
     
     def analyze_disease(self, disease_name, data_sources=None, analysis_level=None, simulate=False, validate=False):
         """Analyze a disease and generate insights"""
-        self.logger.info(f"Starting analysis of {disease_name}...")
+        self.logger.info("Starting analysis of %s...", disease_name)
         
         level = analysis_level or self.config["default_level"]
         if level not in self.config["analysis_levels"]:
             level = self.config["default_level"]
-            self.logger.warning(f"Invalid analysis level. Using default: {level}")
+            self.logger.warning("Invalid analysis level. Using default: %s", level)
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         result_id = f"{disease_name.replace(' ', '_')}_cycle1_{timestamp}"
@@ -113,60 +116,69 @@ class REASONSystem:
         }
         
         # Simulate different stages of analysis
-        self.logger.info(f"Retrieving information about {disease_name}...")
-        time.sleep(1)  # Simulate processing time
+        self.logger.info("Retrieving information about %s...", disease_name)
+        if self.config.get("simulate_latency"):
+            time.sleep(1)  # Simulate processing time
         
         self.logger.info("Loading and preprocessing datasets...")
-        time.sleep(2)  # Simulate processing time
+        if self.config.get("simulate_latency"):
+            time.sleep(2)  # Simulate processing time
         
         self.logger.info("Integrating multi-omics data...")
-        time.sleep(2)  # Simulate processing time
+        if self.config.get("simulate_latency"):
+            time.sleep(2)  # Simulate processing time
         
         self.logger.info("Identifying affected pathways...")
         results["results"]["pathways"] = ["inflammatory_response", "mitochondrial_dysfunction", "protein_degradation"]
-        time.sleep(1.5)  # Simulate processing time
+        if self.config.get("simulate_latency"):
+            time.sleep(1.5)  # Simulate processing time
         
         self.logger.info("Identifying therapeutic targets...")
         results["results"]["targets"] = ["GENE1", "GENE2", "PROTEIN1"]
-        time.sleep(2)  # Simulate processing time
+        if self.config.get("simulate_latency"):
+            time.sleep(2)  # Simulate processing time
         
         self.logger.info("Predicting potential drug candidates...")
         results["results"]["drugs"] = ["COMPOUND1", "COMPOUND2", "REPURPOSED_DRUG1"]
-        time.sleep(2)  # Simulate processing time
+        if self.config.get("simulate_latency"):
+            time.sleep(2)  # Simulate processing time
         
         # Save results
         result_file = os.path.join(self.config["results_dir"], f"{result_id}.json")
-        with open(result_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        with open(result_file, 'wb') as f:
+            f.write(dumps(results))
         
         # Generate a summary text file
         summary_file = os.path.join(self.config["results_dir"], f"{result_id}_summary.txt")
-        with open(summary_file, 'w') as f:
-            f.write(f"REASON Analysis Summary for {disease_name}\n")
-            f.write(f"Date: {timestamp}\n")
-            f.write(f"Analysis Level: {level}\n\n")
-            f.write("Key Findings:\n")
-            f.write("1. Affected Pathways:\n")
-            for pathway in results["results"]["pathways"]:
-                f.write(f"   - {pathway}\n")
-            f.write("\n2. Therapeutic Targets:\n")
-            for target in results["results"]["targets"]:
-                f.write(f"   - {target}\n")
-            f.write("\n3. Potential Drug Candidates:\n")
-            for drug in results["results"]["drugs"]:
-                f.write(f"   - {drug}\n")
-        
-        self.logger.info(f"Analysis complete. Results saved to {result_file}")
-        self.logger.info(f"Summary available at {summary_file}")
+        summary = bytearray()
+        summary += f"REASON Analysis Summary for {disease_name}\n".encode("utf-8")
+        summary += f"Date: {timestamp}\n".encode("utf-8")
+        summary += f"Analysis Level: {level}\n\n".encode("utf-8")
+        summary += b"Key Findings:\n"
+        summary += b"1. Affected Pathways:\n"
+        for pathway in results["results"]["pathways"]:
+            summary += f"   - {pathway}\n".encode("utf-8")
+        summary += b"\n2. Therapeutic Targets:\n"
+        for target in results["results"]["targets"]:
+            summary += f"   - {target}\n".encode("utf-8")
+        summary += b"\n3. Potential Drug Candidates:\n"
+        for drug in results["results"]["drugs"]:
+            summary += f"   - {drug}\n".encode("utf-8")
+        with open(summary_file, 'wb') as f:
+            f.write(summary)
+        
+        self.logger.info("Analysis complete. Results saved to %s", result_file)
+        self.logger.info("Summary available at %s", summary_file)
         
         return results
     
     def run_simulation(self, disease_name, treatment_id=None):
         """Run a systems biology simulation for a disease or treatment"""
-        self.logger.info(f"Running simulation for {disease_name}...")
+        self.logger.info("Running simulation for %s...", disease_name)
         
         # Simulation logic would go here
-        time.sleep(3)  # Simulate processing time
+        if self.config.get("simulate_latency"):
+            time.sleep(3)  # Simulate processing time
         
         self.logger.info("Simulation completed")
         return {
@@ -178,13 +190,14 @@ class REASONSystem:
     
     def validate_results(self, disease_name, results):
         """Validate results against known data"""
-        self.logger.info(f"Validating results for {disease_name}...")
+        self.logger.info("Validating results for %s...", disease_name)
         
         # Validation logic would go here
-        time.sleep(2)  # Simulate processing time
+        if self.config.get("simulate_latency"):
+            time.sleep(2)  # Simulate processing time
         
         validation_score = 0.85  # Example score
-        self.logger.info(f"Validation completed. Score: {validation_score:.2f}")
+        self.logger.info("Validation completed. Score: %.2f", validation_score)
         return validation_score
     
     def shutdown(self):
@@ -245,7 +258,7 @@ def main():
         return 0
     
     except Exception as e:
-        logger.error(f"Error in REASON system: {str(e)}")
+        logger.error("Error in REASON system: %s", e)
         return 1
 
 